@@ -28,9 +28,9 @@ def combine_files(directory):
     return combined_df
 
 
-def main():
+def main(argv=None):
 
-    config = get_config()
+    config = get_config(argv)
     combined_df = combine_files(config['subdirectory'])
     csv_handler = CSVHandler(combined_df)
     csv_handler.clean_and_deduplicate('project_url')
@@ -2,7 +2,7 @@ import os
 import argparse
 
 
-def get_config():
+def get_config(argv=None):
     parser = argparse.ArgumentParser(
         description='Process course and year for data analysis.'
     )
@@ -14,7 +14,7 @@ def get_config():
         '--base_path', type=str, default='Data', help='Base path for data storage'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     course = args.course
     year = args.year
@@ -1,5 +1,6 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 from dotenv import load_dotenv
@@ -11,6 +12,9 @@ from utils.github_url_constructor import GithubURLConstructor
 
 from .config import get_config
 
+# README characters passed on to the title generation
+README_MAX_CHARACTERS = 3500
+
 load_dotenv()
 
 print("Debug: MY_GITHUB_TOKEN:", os.environ.get('MY_GITHUB_TOKEN'))
@@ -23,8 +27,8 @@ logging.basicConfig(
 )
 
 
-def main():
-    config = get_config()
+def main(argv=None, max_workers=10):
+    config = get_config(argv)
     cleaned_csv_path = config['cleaned_csv_path']
     titles_csv_path = config['titles_csv_path']
 
@@ -41,12 +45,10 @@ def main():
     print(f"Total URLs to Process: {len(csv_handler.df)}")
     url_constructor = GithubURLConstructor()
 
-    def truncate_text(text, max_characters=3500):
+    def truncate_text(text, max_characters=README_MAX_CHARACTERS):
         return text[:max_characters]
 
-    titles = []
-
-    for index, row in csv_handler.df.iterrows():
+    def title_for_row(index, row):
         logging.info(f"Debug: Index: {index}, Row Data: {row}")
         project_url = row['project_url']
 
@@ -71,24 +73,26 @@ def main():
 
         if pd.notnull(row['project_title']):
             print(f"Project title already exists for {github_url}. Skipping.")
-            titles.append(row['project_title'])
-            continue
+            return row['project_title']
 
-        readme_content = github_api.get_readme_content(github_url)
+        # Only the start is used; UTF-8 needs at most 4 bytes per character
+        readme_content = github_api.get_readme_content(
+            github_url, max_bytes=4 * README_MAX_CHARACTERS
+        )
         logging.info(
             f"GitHub API Response: {readme_content if readme_content else 'None'}"
         )
         if not readme_content:
             print(f"No README content found for {github_url}. Skipping.")
             logging.warning(f"No README content found for {github_url}. Skipping.")
-            titles.append("Unknown")
-            continue
+            return "Unknown"
 
         # Truncate the README content
         readme_content = truncate_text(readme_content)
-        summary = openai_api.generate_summary(readme_content)
-        # Generate multiple titles
-        multiple_titles = openai_api.generate_multiple_titles(project_url, summary)
+        # Summarize and generate multiple titles in a single completion
+        summary, multiple_titles = openai_api.generate_summary_and_titles(
+            project_url, readme_content
+        )
         print(f"Generated multiple titles for {row['project_url']}: {multiple_titles}")
 
         # Evaluate and revise titles
@@ -98,10 +102,14 @@ def main():
         print(f"Evaluation Feedback: {feedback}")
         print(f"Best Revised Title: {best_title}")
 
-        titles.append(best_title)
-        # title = openai_api.generate_title(summary)
-        # print(f"Generated title for {row['project_url']}: {title}")
-        # titles.append(title)
+        return best_title
+
+    # Each project is two GitHub/OpenAI round trips and no CPU work, so a small
+    # pool overlaps them; map() keeps the titles in row order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        titles = list(
+            executor.map(lambda item: title_for_row(*item), csv_handler.df.iterrows())
+        )
 
     csv_handler.update_titles(titles)
 
@@ -32,7 +32,11 @@ def main():
         subdirectory, f"cleaned_scraped_{course}_{year}.csv"
     )
 
-    csv_handler = CSVHandler(csv_path)
+    # Load only project_url when the file has it; otherwise read everything so
+    # clean_and_deduplicate can warn and leave the data as it is
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = ['project_url'] if 'project_url' in header else None
+    csv_handler = CSVHandler(csv_path, usecols=usecols)
     csv_handler.clean_and_deduplicate('project_url')
     csv_handler.save(cleaned_csv_path)
 
@@ -0,0 +1,56 @@
+import pandas as pd
+
+from utils.csv_handler import CSVHandler
+
+
+def test_clean_and_deduplicate_collapses_slashes_and_git_suffix():
+    csv_handler = CSVHandler(
+        pd.DataFrame(
+            {
+                'project_url': [
+                    'https://github.com/a/b',
+                    'https://github.com/a/b/',
+                    'https://github.com/a/b.git',
+                    ' https://github.com/a/b.git// ',
+                    'https://github.com/a/c',
+                ]
+            }
+        )
+    )
+    csv_handler.clean_and_deduplicate('project_url')
+    assert csv_handler.df['project_url'].tolist() == [
+        'https://github.com/a/b',
+        'https://github.com/a/c',
+    ]
+
+
+def test_clean_and_deduplicate_drops_empty_rows():
+    csv_handler = CSVHandler(
+        pd.DataFrame({'project_url': ['https://github.com/a/b', None, float('nan')]})
+    )
+    csv_handler.clean_and_deduplicate('project_url')
+    assert csv_handler.df['project_url'].tolist() == ['https://github.com/a/b']
+
+
+def test_clean_and_deduplicate_keeps_one_missing_url():
+    csv_handler = CSVHandler(
+        pd.DataFrame(
+            {
+                'project_url': ['https://github.com/a/b', None, None],
+                'project_title': ['B', 'C', 'D'],
+            }
+        )
+    )
+    csv_handler.clean_and_deduplicate('project_url')
+    assert csv_handler.df['project_url'].isna().tolist() == [False, True]
+
+
+def test_clean_and_deduplicate_empty_column(tmp_path):
+    csv_path = tmp_path / 'scraped.csv'
+    csv_path.write_text('project_url,project_title\n,A\n,B\n')
+    csv_handler = CSVHandler(str(csv_path), usecols=['project_url'])
+    csv_handler.clean_and_deduplicate('project_url')
+    cleaned_csv_path = tmp_path / 'cleaned.csv'
+    csv_handler.save(cleaned_csv_path)
+    assert csv_handler.df.empty
+    assert cleaned_csv_path.read_text() == 'project_url\n'
@@ -0,0 +1,113 @@
+import re
+import random
+
+import pytest
+
+from utils.cache_handler import CacheHandler
+from utils.deployment_checker import KeywordMatcher, DeploymentChecker
+from src.check_and_save_deployment import (
+    BATCH_KEYWORDS,
+    CLOUD_KEYWORDS,
+    STREAMING_KEYWORDS,
+    WEB_SERVICE_KEYWORDS,
+)
+
+ALL_KEYWORDS = (
+    BATCH_KEYWORDS
+    + WEB_SERVICE_KEYWORDS
+    + STREAMING_KEYWORDS
+    + [keyword for keywords in CLOUD_KEYWORDS.values() for keyword in keywords]
+)
+
+
+def search(keyword, content):
+    """The per-keyword search KeywordMatcher replaces."""
+    return re.search(r'\b' + re.escape(keyword) + r'\b', content, re.IGNORECASE)
+
+
+def random_readmes(count, seed):
+    # Words of the real keywords glued by the separators that matter for \b,
+    # so multi-word and nested keywords ('cloud functions' inside
+    # 'ibm cloud functions') occur often
+    words = [word for keyword in ALL_KEYWORDS for word in keyword.lower().split()]
+    words += ['the', 'foo', 'x']
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(
+            rng.choice(words) + rng.choice([' ', ' ', '-', '.', '\n'])
+            for _ in range(rng.randint(1, 30))
+        )
+
+
+def reference_classification(content):
+    deployment, reason = 'Unknown', 'Unknown'
+    for name, keywords in (
+        ('Batch', BATCH_KEYWORDS),
+        ('Web Service', WEB_SERVICE_KEYWORDS),
+        ('Streaming', STREAMING_KEYWORDS),
+    ):
+        keyword = next((k for k in keywords if search(k, content)), None)
+        if keyword:
+            deployment, reason = name, keyword.lower()
+            break
+
+    provider_counts = {}
+    for provider, keywords in CLOUD_KEYWORDS.items():
+        for keyword in keywords:
+            if search(keyword, content):
+                provider_counts[provider] = provider_counts.get(provider, 0) + 1
+    cloud = 'Unknown'
+    if provider_counts:
+        cloud = sorted(
+            provider_counts,
+            key=lambda x: (-provider_counts[x], list(CLOUD_KEYWORDS).index(x)),
+        )[0]
+    return deployment, reason, cloud
+
+
+@pytest.fixture
+def checker(tmp_path):
+    return DeploymentChecker(
+        BATCH_KEYWORDS,
+        WEB_SERVICE_KEYWORDS,
+        STREAMING_KEYWORDS,
+        CLOUD_KEYWORDS,
+        cache=CacheHandler(str(tmp_path / 'readme_cache.sqlite')),
+    )
+
+
+def test_keyword_matcher_matches_per_keyword_search():
+    matcher = KeywordMatcher(ALL_KEYWORDS)
+    for content in random_readmes(20000, seed=1):
+        expected = {k.lower() for k in ALL_KEYWORDS if search(k, content)}
+        assert matcher.find(content) == expected, content
+
+
+def test_check_deployment_type_matches_reference(checker, monkeypatch):
+    for content in random_readmes(2000, seed=2):
+        monkeypatch.setattr(
+            checker, 'fetch_readme_via_api', lambda url, content=content: content
+        )
+        assert checker.check_deployment_type(
+            'https://github.com/owner/repo'
+        ) == reference_classification(content), content
+
+
+@pytest.mark.parametrize('keywords', [[], [''], ['', 'docker']])
+def test_keyword_matcher_ignores_empty_keywords(keywords):
+    assert KeywordMatcher(keywords).find('run it in docker\n') == (
+        {'docker'} if 'docker' in keywords else set()
+    )
+
+
+def test_check_deployment_type_with_empty_keywords(tmp_path, monkeypatch):
+    checker = DeploymentChecker(
+        [], [''], [], {'AWS': []}, cache=CacheHandler(str(tmp_path / 'cache.sqlite'))
+    )
+    monkeypatch.setattr(checker, 'fetch_readme_via_api', lambda url: 'a readme')
+    assert checker.check_keywords('a readme', []) is None
+    assert checker.check_deployment_type('https://github.com/owner/repo') == (
+        'Unknown',
+        'Unknown',
+        'Unknown',
+    )
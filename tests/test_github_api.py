@@ -0,0 +1,62 @@
+import pytest
+
+import utils.github_api
+from utils.github_api import GitHubAPI
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.content = body
+        self.status_code = status_code
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start : start + chunk_size]
+
+
+class FakeSession:
+    def __init__(self, body):
+        self.body = body
+
+    def get(self, url, **kwargs):
+        return FakeResponse(self.body)
+
+
+def get_readme_content(monkeypatch, body, max_bytes=None):
+    monkeypatch.setattr(utils.github_api, 'session', FakeSession(body))
+    return GitHubAPI(None).get_readme_content(
+        'https://api.github.com/repos/a/b/readme', max_bytes=max_bytes
+    )
+
+
+@pytest.mark.parametrize(
+    'character, cut', [('é', 1), ('€', 1), ('€', 2), ('😀', 1), ('😀', 2), ('😀', 3)]
+)
+def test_cut_through_multibyte_character_drops_it(monkeypatch, character, cut):
+    # Cuts land around the end of the first 8192-byte chunk
+    body = b'a' * 8190 + character.encode('utf-8') + b'tail'
+    assert get_readme_content(monkeypatch, body, max_bytes=8190 + cut) == 'a' * 8190
+
+
+@pytest.mark.parametrize('max_bytes', [None, 10, 100])
+def test_whole_body_is_decoded(monkeypatch, max_bytes):
+    body = 'Ünïcödé README 😀'.encode('utf-8')
+    text = get_readme_content(monkeypatch, body, max_bytes=max_bytes)
+    assert text == body[:max_bytes].decode('utf-8', errors='ignore')
+
+
+def test_cut_on_character_boundary(monkeypatch):
+    body = ('€' * 10).encode('utf-8')
+    assert get_readme_content(monkeypatch, body, max_bytes=9) == '€€€'
+
+
+@pytest.mark.parametrize('max_bytes', [None, 6, 100])
+def test_invalid_utf8_returns_none(monkeypatch, max_bytes):
+    body = b'ab\xffcdefgh'
+    assert get_readme_content(monkeypatch, body, max_bytes=max_bytes) is None
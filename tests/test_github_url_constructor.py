@@ -0,0 +1,90 @@
+import re
+import random
+from urllib.parse import urlsplit
+
+import pytest
+
+from utils.github_url_constructor import GithubURLConstructor
+
+README_API = 'https://api.github.com/repos/a/b/readme'
+
+
+def reference_readme_api_urls(project_url):
+    """The urlsplit-based parsing _GITHUB_URL_RE replaces."""
+    split_url = urlsplit(project_url)
+    if split_url.netloc.lower() not in ('github.com', 'www.github.com'):
+        return None, None
+
+    parts = split_url.path.lstrip('/').split('/', 2)
+    if len(parts) < 2 or not parts[1]:
+        return None, None
+    owner, repo = parts[:2]
+    if repo.endswith('.git') and repo != '.git':
+        repo = repo[: -len('.git')]
+    additional_path = parts[2] if len(parts) > 2 else ''
+
+    if 'README.md' in additional_path.split('/'):
+        return f"https://api.github.com/repos/{owner}/{repo}/contents/README.md", None
+
+    branch = None
+    branch_match = re.match(r'^(?:tree|blob)/([^/]+)/?', additional_path)
+    if branch_match:
+        branch = branch_match.group(1)
+        additional_path = additional_path[branch_match.end() :]
+    additional_path = additional_path.strip('/')
+
+    readme_api_base = f"https://api.github.com/repos/{owner}/{repo}/readme"
+    if not additional_path:
+        return readme_api_base, None
+    stripped_path = (
+        additional_path.replace(f'{branch}/', '', 1) if branch else additional_path
+    )
+    readme_api_url_without_main = None
+    if stripped_path != additional_path:
+        readme_api_url_without_main = f"{readme_api_base}/{stripped_path}"
+    return f"{readme_api_base}/{additional_path}", readme_api_url_without_main
+
+
+def random_urls(count, seed):
+    hosts = ['github.com', 'GitHub.com', 'www.github.com', 'gitlab.com']
+    segments = ['a', 'b', 'b.git', '.git', 'main', 'tree', 'blob', 'README.md', '']
+    rng = random.Random(seed)
+    for _ in range(count):
+        path = '/'.join(rng.choice(segments) for _ in range(rng.randint(0, 6)))
+        suffix = rng.choice(['', '', '/', '?tab=readme', '#readme'])
+        yield f"{rng.choice(['https', 'http'])}://{rng.choice(hosts)}/{path}{suffix}"
+
+
+@pytest.mark.parametrize(
+    'project_url, expected',
+    [
+        ('https://github.com/a/b', (README_API, None)),
+        ('https://github.com/a/b.git', (README_API, None)),
+        ('https://GitHub.com/a/b/', (README_API, None)),
+        ('https://github.com/a/b?tab=readme-ov-file', (README_API, None)),
+        ('https://github.com/a/b/tree/main', (README_API, None)),
+        ('https://github.com/a/b/sub', (f'{README_API}/sub', None)),
+        ('https://github.com/a/b/tree/main/proj/sub', (f'{README_API}/proj/sub', None)),
+        (
+            'https://github.com/a/b/tree/main/main/x#readme',
+            (f'{README_API}/main/x', f'{README_API}/x'),
+        ),
+        (
+            'https://github.com/a/b/blob/master/README.md',
+            ('https://api.github.com/repos/a/b/contents/README.md', None),
+        ),
+        ('https://gitlab.com/a/b', (None, None)),
+        ('https://a.github.io/b', (None, None)),
+        ('https://github.com/a', (None, None)),
+    ],
+)
+def test_construct_readme_api_url(project_url, expected):
+    assert GithubURLConstructor().construct_readme_api_url(project_url) == expected
+
+
+def test_construct_readme_api_url_matches_reference():
+    constructor = GithubURLConstructor()
+    for project_url in random_urls(20000, seed=1):
+        assert constructor.construct_readme_api_url(
+            project_url
+        ) == reference_readme_api_urls(project_url), project_url
@@ -0,0 +1,55 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils.openai_api import OpenAIAPI
+from utils.cache_handler import CacheHandler
+
+PROJECT_URL = 'https://github.com/owner/repo'
+
+
+def chunk(content):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=SimpleNamespace(content=content))]
+    )
+
+
+@pytest.fixture
+def openai_api(tmp_path):
+    return OpenAIAPI('test-key', cache=CacheHandler(str(tmp_path / 'llm_cache.sqlite')))
+
+
+def test_failed_regeneration_is_retried(openai_api, monkeypatch):
+    calls = []
+
+    def create_completion(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            yield chunk('Owner Repo Data Pipeline\nCut')
+            raise ConnectionError('stream dropped')
+        yield chunk('Owner Repo Data Pipeline\nRepo Tracker: Owner Data\n')
+
+    monkeypatch.setattr(openai_api, '_create_completion', create_completion)
+
+    # The complete line that arrived before the error is still used
+    assert openai_api.evaluate_and_revise_titles([], PROJECT_URL, 'data')[1] == (
+        'Owner Repo Data Pipeline'
+    )
+    assert openai_api.evaluate_and_revise_titles([], PROJECT_URL, 'data')[1] == (
+        'Repo Tracker: Owner Data'
+    )
+    assert openai_api.evaluate_and_revise_titles([], PROJECT_URL, 'data')[1] == (
+        'Repo Tracker: Owner Data'
+    )
+    assert len(calls) == 2
+
+
+def test_llm_stream_swallows_errors_by_default(openai_api, monkeypatch):
+    def create_completion(**kwargs):
+        yield chunk('first\nsec')
+        raise ConnectionError('stream dropped')
+
+    monkeypatch.setattr(openai_api, '_create_completion', create_completion)
+    assert list(openai_api.llm_stream('prompt')) == ['first']
+    with pytest.raises(ConnectionError):
+        list(openai_api.llm_stream('prompt', reraise=True))
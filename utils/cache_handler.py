@@ -0,0 +1,38 @@
+import os
+import zlib
+import sqlite3
+import threading
+
+
+class CacheHandler:
+    """Thread-safe sqlite key/value store for response bodies and their ETags."""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, etag TEXT, body BLOB)"
+            )
+
+    def get(self, key):
+        """Return an (etag, body) tuple for the key, or None if it is not cached."""
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, body FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        etag, body = row
+        return etag, zlib.decompress(body)
+
+    def set(self, key, body, etag=None):
+        with self.lock, self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache (key, etag, body) VALUES (?, ?, ?)",
+                (key, etag, zlib.compress(body)),
+            )
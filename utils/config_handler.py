@@ -1,5 +1,8 @@
 import os
 
+# Subdirectories already created by this process; skips repeated mkdir syscalls
+_MKDIR_CACHE = set()
+
 
 def get_config(csv_path):
     parts = csv_path.split('/')
@@ -11,7 +14,9 @@ def get_config(csv_path):
     year = parts[-2]
 
     subdirectory = os.path.join(base_path, course, year)
-    os.makedirs(subdirectory, exist_ok=True)
+    if subdirectory not in _MKDIR_CACHE:
+        os.makedirs(subdirectory, exist_ok=True)
+        _MKDIR_CACHE.add(subdirectory)
 
     base_name = f"scraped_{course}_{year}"
     output_prefix = f"projects_{course}_{year}"
@@ -2,9 +2,10 @@ import pandas as pd
 
 
 class CSVHandler:
-    def __init__(self, data):
+    def __init__(self, data, usecols=None):
         if isinstance(data, str):
-            self.df = pd.read_csv(data)
+            # Restricting columns keeps wide CSVs from being fully materialized
+            self.df = pd.read_csv(data, usecols=usecols)
         elif isinstance(data, pd.DataFrame):
             self.df = data
         else:
@@ -20,11 +21,16 @@ class CSVHandler:
     def clean_and_deduplicate(self, column_name='project_url'):
         self.df = self.df.dropna(how='all')
 
-        if column_name in self.df.columns:
-            self.df = self.df[[column_name]].copy()
-        else:
+        if column_name not in self.df.columns:
             print(f"Warning: '{column_name}' not found in columns, skipping.")
             return
 
-        # Remove duplicates
-        self.df = self.df.drop_duplicates()
+        # 'https://github.com/x/y/' and 'https://github.com/x/y.git' are the same
+        # project, so trailing slashes and a '.git' suffix are dropped first
+        # An all-empty column is read as float64, which has no .str accessor
+        values = self.df[column_name].astype('string').str.strip()
+        values = values.str.replace(r'(?:\.git)?/*$', '', regex=True)
+
+        # Remove duplicates; pd.unique hashes the single column directly and keeps
+        # first-seen order, without copying the column into an interim frame
+        self.df = pd.DataFrame({column_name: pd.unique(values)})
@@ -1,63 +1,136 @@
-import os
 import re
 import base64
 import logging
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
 
+from utils.http_session import session
+from utils.cache_handler import CacheHandler
 from utils.github_url_constructor import GithubURLConstructor
 
-logging.basicConfig(level=logging.DEBUG, filename='debug.log', filemode='a')
+logger = logging.getLogger(__name__)
 
-headers = {"Authorization": f"token {os.environ.get('MY_GITHUB_TOKEN')}"}
 
-print(headers)
+class KeywordMatcher:
+    """Find which of a list of keywords occur in a text with a single regex scan.
+
+    Keywords are lowercased and matched case-sensitively, so `find` expects
+    lowercase content (README content is lowercased when it is fetched).
+    """
+
+    def __init__(self, keywords):
+        # Longest keywords first, so that at any position the alternation picks
+        # the longest keyword; shorter keywords matching at the same position
+        # are word-bounded prefixes of it and are recovered via `implied`.
+        ordered = sorted(
+            {keyword.lower() for keyword in keywords if keyword}, key=len, reverse=True
+        )
+        # The lookahead does not consume input, so keywords nested inside a
+        # longer one (e.g. 'cloud functions' in 'ibm cloud functions') still match.
+        # Without keywords there is no pattern: an empty alternation would match
+        # at every word boundary.
+        self.pattern = (
+            re.compile(r'(?=\b(' + '|'.join(map(re.escape, ordered)) + r')\b)')
+            if ordered
+            else None
+        )
+        self.implied = {
+            keyword: {keyword}
+            | {
+                other
+                for other in ordered
+                if re.match(r'\b' + re.escape(other) + r'\b', keyword)
+            }
+            for keyword in ordered
+        }
+
+    def find(self, content):
+        found = set()
+        if self.pattern is None:
+            return found
+        for match in self.pattern.finditer(content):
+            found |= self.implied[match.group(1)]
+        return found
+
+
+@functools.lru_cache(maxsize=None)
+def keyword_matcher(keywords):
+    """Return a cached KeywordMatcher for a tuple of keywords."""
+    return KeywordMatcher(keywords)
 
 
 class DeploymentChecker:
     def __init__(
-        self, batch_keywords, web_service_keywords, streaming_keywords, cloud_keywords
+        self,
+        batch_keywords,
+        web_service_keywords,
+        streaming_keywords,
+        cloud_keywords,
+        *,
+        cache=None,
     ):
-        self.batch_keywords = batch_keywords
-        self.web_service_keywords = web_service_keywords
-        self.streaming_keywords = streaming_keywords
-        self.cloud_keywords = cloud_keywords
+        self.batch_keywords = [keyword.lower() for keyword in batch_keywords]
+        self.web_service_keywords = [
+            keyword.lower() for keyword in web_service_keywords
+        ]
+        self.streaming_keywords = [keyword.lower() for keyword in streaming_keywords]
+        self.cloud_keywords = {
+            provider: [keyword.lower() for keyword in keywords]
+            for provider, keywords in cloud_keywords.items()
+        }
         self.url_constructor = GithubURLConstructor()
+        if cache is None:
+            cache = CacheHandler('.cache/readme_cache.sqlite')
+        self.cache = cache
+        # One matcher over every keyword list, so a README is scanned only once
+        # for both the deployment type and the cloud provider
+        self._matcher = keyword_matcher(
+            tuple(
+                self.batch_keywords
+                + self.web_service_keywords
+                + self.streaming_keywords
+                + [
+                    keyword
+                    for keywords in self.cloud_keywords.values()
+                    for keyword in keywords
+                ]
+            )
+        )
 
-    def check_keywords(self, content, keywords):
+    def check_keywords(self, content, keywords, found=None):
+        if found is None:
+            found = keyword_matcher(tuple(keywords)).find(content)
         for keyword in keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', content, re.IGNORECASE):
+            if keyword.lower() in found:
                 return keyword
         return None
 
-    def check_cloud_provider(self, content):
+    def check_cloud_provider(self, content, found=None):
         # logging.debug(
         #     f"Checking for cloud provider in content: {content[:100]}..."
         # )
         provider_counts = {}
+        if found is None:
+            found = self._matcher.find(content)
 
         for provider, keywords in self.cloud_keywords.items():
             for keyword in keywords:
-                if re.search(
-                    r'\b' + re.escape(keyword) + r'\b', content, re.IGNORECASE
-                ):
-                    logging.debug(
-                        f"Found cloud provider {provider} for keyword {keyword}"
+                if keyword.lower() in found:
+                    logger.debug(
+                        "Found cloud provider %s for keyword %s", provider, keyword
                     )
                     provider_counts[provider] = provider_counts.get(provider, 0) + 1
 
         # If multiple providers are found, prioritize based on frequency and order in cloud_keywords
         if provider_counts:
-            sorted_providers = sorted(
-                provider_counts.keys(),
-                key=lambda x: (
-                    -provider_counts[x],
-                    list(self.cloud_keywords.keys()).index(x),
-                ),
-            )
-            return sorted_providers[0]
+            # provider_counts follows cloud_keywords order and max() keeps the
+            # first of equal counts, so ties go to the earlier provider
+            return max(provider_counts, key=provider_counts.get)
 
-        logging.debug("No cloud provider found.")
+        logger.debug("No cloud provider found.")
         return 'Unknown'
 
     def fetch_readme_via_api(self, project_url):
@@ -66,38 +139,56 @@ class DeploymentChecker:
             api_url_without_main,
         ) = self.url_constructor.construct_readme_api_url(project_url)
 
-        if api_url_with_main is None and api_url_without_main is None:
-            return None
+        for api_url in (api_url_with_main, api_url_without_main):
+            if api_url is None:
+                continue
+            readme_content = self.fetch_readme(api_url)
+            if readme_content is not None:
+                return readme_content
 
-        # Try the first URL
-        response = requests.get(api_url_with_main, headers=headers, timeout=20)
-        if response.status_code == 200:
-            json_data = response.json()
-            readme_content = base64.b64decode(json_data['content']).decode('utf-8')
-            return readme_content.lower()
-        else:
-            logging.debug(
-                f"Failed to fetch README via API for URL {api_url_with_main}: {response.status_code}"
-            )
+        return None
 
-        # Try the second URL if the first one fails
-        response = requests.get(api_url_without_main, headers=headers, timeout=20)
+    def fetch_readme(self, api_url):
+        """Fetch a lowercased README, revalidating any cached copy with its ETag."""
+        cached = self.cache.get(api_url)
+        # Ask for the raw file so there is no JSON to parse and no base64 to decode
+        request_headers = {'Accept': 'application/vnd.github.raw'}
+        if cached and cached[0]:
+            request_headers['If-None-Match'] = cached[0]
+
+        response = session.get(api_url, headers=request_headers, timeout=20)
+        raw = True
+        if response.status_code in (406, 415):
+            request_headers.pop('Accept')
+            response = session.get(api_url, headers=request_headers, timeout=20)
+            raw = False
+
+        if response.status_code == 304 and cached:
+            return cached[1].decode('utf-8')
         if response.status_code == 200:
-            json_data = response.json()
-            readme_content = base64.b64decode(json_data['content']).decode('utf-8')
-            return readme_content.lower()
-        else:
-            logging.debug(
-                f"Failed to fetch README via API for URL {api_url_without_main}: {response.status_code}"
-            )
+            if raw:
+                readme_bytes = response.content
+            else:
+                json_data = orjson.loads(response.content)
+                readme_bytes = base64.b64decode(json_data['content'])
+            readme_content = readme_bytes.decode('utf-8').lower()
+            etag = response.headers.get('ETag')
+            if etag:
+                self.cache.set(api_url, readme_content.encode('utf-8'), etag)
+            return readme_content
 
+        logger.debug(
+            "Failed to fetch README via API for URL %s: %s",
+            api_url,
+            response.status_code,
+        )
         return None
 
     def check_deployment_type(self, url):
         # use Github API instead of web scrape
         try:
             if url is None:
-                logging.debug("Received None URL. Skipping.")
+                logger.debug("Received None URL. Skipping.")
                 return 'Unknown', 'Unknown', 'Unknown'
 
             # Sanitize the URL to remove any fragment
@@ -106,7 +197,7 @@ class DeploymentChecker:
             # Now use the sanitized URL to fetch the README
             readme_content = self.fetch_readme_via_api(sanitized_url)
             if readme_content is None:
-                logging.debug(f"No README found for URL: {url}")
+                logger.debug("No README found for URL: %s", url)
                 return 'Unknown', 'Unknown', 'Unknown'
 
             # logging.debug(f"Entire Readme content for URL {url}: {readme_content}")
@@ -115,41 +206,59 @@ class DeploymentChecker:
             reason_keyword = 'Unknown'
 
             # Debug logging for cloud keyword search
-            logging.debug(f"Checking cloud keywords for URL: {url}")
+            logger.debug("Checking cloud keywords for URL: %s", url)
             # logging.debug(
             #     f"Readme content: {readme_content[:100]}..."
             # )  # First 100 characters of README
 
+            # Single pass over the README for every keyword category
+            found = self._matcher.find(readme_content)
+
             # Check for deployment type
-            keyword = self.check_keywords(readme_content, self.batch_keywords)
+            keyword = self.check_keywords(readme_content, self.batch_keywords, found)
             if keyword:
                 deployment_keyword = 'Batch'
                 reason_keyword = keyword
             else:
-                keyword = self.check_keywords(readme_content, self.web_service_keywords)
+                keyword = self.check_keywords(
+                    readme_content, self.web_service_keywords, found
+                )
                 if keyword:
                     deployment_keyword = 'Web Service'
                     reason_keyword = keyword
                 else:
                     keyword = self.check_keywords(
-                        readme_content, self.streaming_keywords
+                        readme_content, self.streaming_keywords, found
                     )
                     if keyword:
                         deployment_keyword = 'Streaming'
                         reason_keyword = keyword
 
             # Check for cloud tool
-            cloud_provider = self.check_cloud_provider(readme_content)
+            cloud_provider = self.check_cloud_provider(readme_content, found)
 
             if cloud_provider == 'Unknown':
-                logging.debug(f"No cloud keyword found in README for URL: {url}")
+                logger.debug("No cloud keyword found in README for URL: %s", url)
             else:
-                logging.debug(
-                    f"Found cloud provider {cloud_provider} in README for URL: {url}"
+                logger.debug(
+                    "Found cloud provider %s in README for URL: %s", cloud_provider, url
                 )
 
             return deployment_keyword, reason_keyword, cloud_provider
 
         except requests.exceptions.RequestException as e:
-            logging.error(f"Error checking for URL {url}: {e}")
+            logger.error("Error checking for URL %s: %s", url, e)
             return 'Error', 'Error', 'Error'
+
+    def check_many(self, urls, max_workers=16):
+        """Check the deployment type of many URLs concurrently, keeping input order."""
+
+        def check(url):
+            try:
+                return self.check_deployment_type(url)
+            except Exception as e:
+                logger.error("Error checking deployment for URL %s: %s", url, e)
+                return 'Unknown', 'Error', 'Unknown'
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(check, urls))
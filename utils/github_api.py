@@ -1,39 +1,58 @@
-import json
-import base64
-
 import requests
 
+from utils.http_session import session
+
 
 class GitHubAPI:
     def __init__(self, token):
         self.token = token
 
-    def get_readme_content(self, github_url):
-        headers = {'Authorization': f'token {self.token}'}
+    def get_readme_content(self, github_url, max_bytes=None):
+        """Fetch a README as text, optionally only its first `max_bytes` bytes.
+
+        With `max_bytes` the body is streamed and the connection released as soon
+        as enough has arrived, so long READMEs are not downloaded in full.
+        """
+        headers = {'Accept': 'application/vnd.github.raw'}
+        # Without a token the shared session's token pool authenticates the request
+        if self.token:
+            headers['Authorization'] = f'token {self.token}'
         # print(headers)
         try:
-            response = requests.get(github_url, headers=headers, timeout=10)
-            if response.status_code != 200:
-                # print(
-                #     f"Failed to fetch README for {github_url}. Status code: {response.status_code}"
-                # )
-                # print("Response Content:", response.content.decode())
-                return None
-
-            response_json = response.json()
-            if 'content' not in response_json:
-                # print(f"No README content found for {github_url}.")
-                return None
-
-            readme_content_base64 = response_json['content']
-            readme_content = base64.b64decode(readme_content_base64).decode('utf-8')
+            with session.get(
+                github_url, headers=headers, timeout=10, stream=max_bytes is not None
+            ) as response:
+                if response.status_code != 200:
+                    # print(
+                    #     f"Failed to fetch README for {github_url}. Status code: {response.status_code}"
+                    # )
+                    # print("Response Content:", response.content.decode())
+                    return None
+
+                if max_bytes is None:
+                    readme_bytes = response.content
+                else:
+                    readme_bytes = b''
+                    for chunk in response.iter_content(chunk_size=8192):
+                        readme_bytes += chunk
+                        if len(readme_bytes) >= max_bytes:
+                            break
+                    readme_bytes = readme_bytes[:max_bytes]
+
+            try:
+                readme_content = readme_bytes.decode('utf-8')
+            except UnicodeDecodeError as e:
+                # The cut may split a multi-byte character; only that is dropped
+                if len(readme_bytes) != max_bytes or max_bytes - e.start > 3:
+                    raise
+                readme_content = readme_bytes[: e.start].decode('utf-8')
             # print("Decoded README content:", readme_content[:500])
             return readme_content
 
         except requests.exceptions.RequestException as e:
             print(f"Request exception for {github_url}: {e}")
-        except json.JSONDecodeError as e:
-            print(f"JSON decode error for {github_url}: {e}")
+        except UnicodeDecodeError as e:
+            print(f"UTF-8 decode error for {github_url}: {e}")
         except Exception as e:
             print(f"An unexpected error occurred for {github_url}: {e}")
         return None
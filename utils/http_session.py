@@ -0,0 +1,104 @@
+import os
+import time
+import functools
+import itertools
+import threading
+from urllib.parse import urlsplit
+
+import requests
+from urllib3.util import Retry
+from requests.auth import AuthBase
+from requests.adapters import HTTPAdapter
+
+
+class TokenPoolAuth(AuthBase):
+    """Rotate GitHub API tokens round-robin, skipping tokens near their rate limit.
+
+    Tokens come from the comma-separated MY_GITHUB_TOKENS variable, falling back to
+    MY_GITHUB_TOKEN. They are read on first use so a later load_dotenv() is honoured.
+    Requests that already carry an Authorization header are left untouched.
+    """
+
+    def __init__(self, tokens=None, min_remaining=50):
+        self.tokens = tokens
+        self.min_remaining = min_remaining
+        self.lock = threading.Lock()
+        self.cycle = None
+        # token -> epoch second of its rate limit reset, once it is nearly used up
+        self.reset_at = {}
+
+    def next_token(self):
+        with self.lock:
+            if self.cycle is None:
+                if self.tokens is None:
+                    value = os.environ.get('MY_GITHUB_TOKENS') or os.environ.get(
+                        'MY_GITHUB_TOKEN', ''
+                    )
+                    self.tokens = [t.strip() for t in value.split(',') if t.strip()]
+                self.cycle = itertools.cycle(self.tokens)
+            if not self.tokens:
+                return None
+
+            now = time.time()
+            for _ in range(len(self.tokens)):
+                token = next(self.cycle)
+                if self.reset_at.get(token, 0) <= now:
+                    return token
+            # Every token is exhausted; use the one whose window resets first
+            return min(self.tokens, key=lambda t: self.reset_at[t])
+
+    def track(self, token, response, **kwargs):
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        with self.lock:
+            if int(remaining) < self.min_remaining:
+                self.reset_at[token] = int(reset)
+            else:
+                self.reset_at.pop(token, None)
+
+    def __call__(self, request):
+        if urlsplit(request.url).hostname != 'api.github.com':
+            return request
+        if 'Authorization' in request.headers:
+            return request
+        token = self.next_token()
+        if token:
+            request.headers['Authorization'] = f'token {token}'
+            request.register_hook('response', functools.partial(self.track, token))
+        return request
+
+
+class GitHubRetry(Retry):
+    """Retry that also honours Retry-After on 403 secondary rate limit responses.
+
+    A 403 without a Retry-After header is a permission error and is not retried.
+    """
+
+    RETRY_AFTER_STATUS_CODES = Retry.RETRY_AFTER_STATUS_CODES | frozenset({403})
+
+
+def create_session(pool_connections=16, pool_maxsize=32):
+    """Create a requests session with pooled keep-alive connections and retries."""
+    new_session = requests.Session()
+    # Failures are usually sporadic, so start backing off small and cap it low
+    retries = GitHubRetry(
+        total=3,
+        backoff_factor=0.2,
+        backoff_max=3,
+        status_forcelist=[429, 502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retries,
+    )
+    new_session.mount('https://', adapter)
+    new_session.auth = TokenPoolAuth()
+    return new_session
+
+
+# Shared by all GitHub API callers so TCP/TLS connections are reused across calls
+session = create_session()
@@ -1,12 +1,116 @@
 import re
-import random
+import asyncio
+import threading
 
-from openai import OpenAI
+import orjson
+import xxhash
+from openai import (
+    NOT_GIVEN,
+    OpenAI,
+    RateLimitError,
+    APITimeoutError,
+    APIConnectionError,
+    InternalServerError,
+)
+from tenacity import (
+    retry,
+    wait_exponential,
+    stop_after_attempt,
+    retry_if_exception_type,
+)
+from openai.types import CompletionUsage
+
+from utils.cache_handler import CacheHandler
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\w+')
+_NON_WORD_RE = re.compile(r'\W+')
+# Leading list numbering ('1.', '-') and dash separators in generated titles
+_LIST_MARKER_RE = re.compile(r'^[-\d]+\.\s*|\s*-\s*')
+
+# README characters sent to the model when summarizing
+SUMMARY_MAX_CHARACTERS = 4000
+GENERIC_TERMS = frozenset({'smart', 'intelligent', 'assistant', 'hub', 'companion'})
+
+
+# Transient API failures are usually sporadic, so the first retry comes quickly
+_retry_transient = retry(
+    retry=retry_if_exception_type(
+        (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+    ),
+    wait=wait_exponential(multiplier=0.2, min=0.2, max=3),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+
+
+def _prepare_readme(content):
+    """Collapse whitespace in README content and keep only its opening."""
+    # READMEs forked from the same template often differ only in spacing and
+    # blank lines; collapsing whitespace lets them share one cached completion.
+    # The opening of a README is enough for a two-sentence summary.
+    return _WHITESPACE_RE.sub(' ', content).strip()[:SUMMARY_MAX_CHARACTERS]
+
+
+def _keywords(project_url, summary):
+    return set(_WORD_RE.findall((project_url + ' ' + summary).lower()))
+
+
+def _score(title, keywords):
+    """Score a title by length, overlap with `keywords` and generic wording."""
+    title_lower = title.lower()
+    words = title_lower.split()
+    return (
+        (2 if 3 <= len(words) <= 5 else -1)
+        + sum(word in keywords for word in words)
+        - sum(term in title_lower for term in GENERIC_TERMS)
+        + (1 if ':' in title or '-' in title else 0)
+    )
+
+
+def _iter_clean_titles(lines):
+    """Strip list markers from non-blank title lines and drop near-duplicates."""
+    # Collapse titles differing only in case or punctuation, keeping the
+    # first spelling, so duplicates are not scored twice
+    seen = set()
+    for line in lines:
+        title = _LIST_MARKER_RE.sub('', line.strip())
+        key = _NON_WORD_RE.sub(' ', title.lower()).strip()
+        if key and key not in seen:
+            seen.add(key)
+            yield title
+
+
+def _recorded(items, record):
+    """Yield `items` unchanged, appending each one to the `record` list."""
+    for item in items:
+        record.append(item)
+        yield item
+
+
+def _best_title(titles, keywords):
+    """Return the highest scoring title and its score, first title on ties."""
+    best_title, best_score = None, float('-inf')
+    for title in titles:
+        score = _score(title, keywords)
+        if score > best_score:
+            best_title, best_score = title, score
+    return best_title, best_score
 
 
 class OpenAIAPI:
-    def __init__(self, api_key):
-        self.client = OpenAI(api_key=api_key)
+    def __init__(self, api_key, cache=None):
+        # Retries are handled by _create_completion instead of the client
+        self.client = OpenAI(api_key=api_key, max_retries=0)
+        if cache is None:
+            cache = CacheHandler('.cache/llm_cache.sqlite')
+        self.cache = cache
+        self.stats = {"hits": 0, "misses": 0}
+        # Projects may be processed from several threads at once
+        self.stats_lock = threading.Lock()
+        # Titles regenerated for a (project_url, summary) pair whose first
+        # titles all scored poorly; retries in the same run reuse them
+        self._regenerated_titles = {}
 
     def build_prompt(self, project_url, summary):
         prompt_template = """
@@ -26,83 +130,227 @@ Generate 5 distinct titles, each on a new line:
 """.strip()
         return prompt_template.format(url=project_url, summary=summary)
 
-    def llm(self, prompt, model='gpt-4o-mini', max_tokens=150):
+    @_retry_transient
+    def _create_completion(self, **kwargs):
+        return self.client.chat.completions.create(**kwargs)
+
+    def llm(
+        self,
+        prompt,
+        model='gpt-4o-mini',
+        max_tokens=150,
+        *,
+        temperature=NOT_GIVEN,
+        response_format=NOT_GIVEN,
+    ):
+        # Only deterministic (temperature=0) completions are worth caching
+        cache_key = None
+        if temperature == 0:
+            cache_key = xxhash.xxh3_128_hexdigest(
+                orjson.dumps(
+                    {
+                        "model": model,
+                        "prompt": prompt,
+                        "max_tokens": max_tokens,
+                        # JSON-mode and plain replies to one prompt differ
+                        "response_format": (
+                            None if response_format is NOT_GIVEN else response_format
+                        ),
+                    },
+                    option=orjson.OPT_SORT_KEYS,
+                )
+            )
+            cached = self.cache.get(cache_key)
+            if cached:
+                with self.stats_lock:
+                    self.stats["hits"] += 1
+                entry = orjson.loads(cached[1])
+                usage = entry["usage"] and CompletionUsage(**entry["usage"])
+                return entry["content"], usage
+            with self.stats_lock:
+                self.stats["misses"] += 1
+
         try:
-            response = self.client.chat.completions.create(
+            response = self._create_completion(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=max_tokens,
+                temperature=temperature,
+                response_format=response_format,
             )
-            return response.choices[0].message.content, response.usage
+            content, usage = response.choices[0].message.content, response.usage
         except Exception as e:
             print(f"An error occurred: {e}")
             return None, None
 
+        if cache_key and content is not None:
+            entry = {"content": content, "usage": usage and usage.model_dump()}
+            self.cache.set(cache_key, orjson.dumps(entry))
+        return content, usage
+
     def generate_summary(self, content):
+        content = _prepare_readme(content)
         prompt_summary = f"Summarize the following GitHub project content in two sentences, focusing on its main purpose and key features:\n{content}"
-        summary, _ = self.llm(prompt_summary, max_tokens=100)
+        summary, _ = self.llm(prompt_summary, max_tokens=100, temperature=0)
         return summary.strip() if summary else ""
 
-    def generate_multiple_titles(self, project_url, summary):
+    def llm_stream(
+        self,
+        prompt,
+        model='gpt-4o-mini',
+        max_tokens=150,
+        temperature=NOT_GIVEN,
+        *,
+        reraise=False,
+    ):
+        """Stream a completion, yielding each line as soon as it is complete.
+
+        API errors end the stream quietly unless `reraise` is set.
+        """
+        buffer = ''
+        try:
+            stream = self._create_completion(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                stream=True,
+            )
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                buffer += chunk.choices[0].delta.content
+                *lines, buffer = buffer.split('\n')
+                yield from lines
+        except Exception as e:
+            if reraise:
+                raise
+            # A line cut off by the error is dropped, earlier lines were complete
+            print(f"An error occurred: {e}")
+            return
+        if buffer:
+            yield buffer
+
+    def iter_titles(self, project_url, summary, *, reraise=False):
+        """Yield cleaned candidate titles while the model is still writing them."""
         title_prompt = self.build_prompt(project_url, summary)
-        titles, _ = self.llm(title_prompt, max_tokens=150)
-        if titles:
-            titles_list = [
-                re.sub(r'^[-\d]+\.\s*|\s*-\s*', '', title.strip())
-                for title in titles.split('\n')
-                if title.strip()
-            ]
-            return list(set(filter(None, titles_list)))
-        return []
+        yield from _iter_clean_titles(
+            self.llm_stream(title_prompt, max_tokens=150, reraise=reraise)
+        )
 
-    def evaluate_title(self, title, project_url, summary):
-        score = 0
-        word_count = len(title.split())
+    def generate_multiple_titles(self, project_url, summary):
+        return list(self.iter_titles(project_url, summary))
 
-        if 3 <= word_count <= 5:
-            score += 2
-        elif word_count < 3 or word_count > 5:
-            score -= 1
+    def build_summary_and_titles_prompt(self, project_url, content):
+        prompt_template = """
+As an AI specializing in creating engaging and descriptive titles for software projects, your task is to summarize a GitHub project and generate 5 unique titles for it. Use the following guidelines:
 
-        keywords = re.findall(r'\w+', project_url.lower() + ' ' + summary.lower())
-        for word in title.lower().split():
-            if word in keywords:
-                score += 1
+1. Summarize the project content in two sentences, focusing on its main purpose and key features.
+2. Analyze the project URL and your summary to extract key information.
+3. Create titles that are concise (3-5 words) and captivating.
+4. Use dynamic verbs and specific nouns related to the project's function.
+5. Avoid generic terms like "Smart", "Intelligent", "Assistant", "Hub", or "Companion" unless central to the project.
+6. Consider using a two-part structure with a colon or dash for clarity.
+7. Ensure the title clearly communicates the project's main purpose or problem it solves.
 
-        generic_terms = ['smart', 'intelligent', 'assistant', 'hub', 'companion']
-        for term in generic_terms:
-            if term in title.lower():
-                score -= 1
+Project URL: {url}
+Project Content: {content}
 
-        if ':' in title or '-' in title:
-            score += 1
+Respond with a JSON object of the form {{"summary": "...", "titles": ["...", "..."]}}.
+""".strip()
+        return prompt_template.format(url=project_url, content=content)
 
-        return score
+    def generate_summary_and_titles(self, project_url, content):
+        """Summarize a project and generate its candidate titles in one completion.
 
-    def evaluate_and_revise_titles(self, titles, project_url, summary):
-        scores = {
-            title: self.evaluate_title(title, project_url, summary) for title in titles
-        }
-        best_title = max(scores, key=scores.get)
-
-        if scores[best_title] < 3:
-            new_titles = self.generate_multiple_titles(project_url, summary)
-            new_scores = {
-                title: self.evaluate_title(title, project_url, summary)
-                for title in new_titles
-            }
-            combined_scores = {**scores, **new_scores}
-            best_title = max(combined_scores, key=combined_scores.get)
-
-        feedback = (
-            f"The best title is '{best_title}' with a score of {scores[best_title]}."
+        Falls back to separate `generate_summary` and `generate_multiple_titles`
+        calls when the reply is not the expected JSON object.
+        """
+        content = _prepare_readme(content)
+        prompt = self.build_summary_and_titles_prompt(project_url, content)
+        # Deterministic, so reruns are served from the cache; revisions go through
+        # the uncached generate_multiple_titles
+        reply, _ = self.llm(
+            prompt,
+            max_tokens=250,
+            temperature=0,
+            response_format={"type": "json_object"},
         )
+        try:
+            result = orjson.loads(reply)
+            summary, titles = result["summary"].strip(), result["titles"]
+            if not isinstance(titles, list):
+                raise TypeError(f"expected a list of titles, got {titles!r}")
+            titles = list(_iter_clean_titles(titles))
+        except (TypeError, KeyError, AttributeError, ValueError) as e:
+            print(f"Could not parse summary and titles, retrying separately: {e}")
+            summary = self.generate_summary(content)
+            return summary, self.generate_multiple_titles(project_url, summary)
+        return summary, titles
+
+    def evaluate_title(self, title, project_url, summary):
+        return _score(title, _keywords(project_url, summary))
+
+    def evaluate_and_revise_titles(self, titles, project_url, summary):
+        # Tokenize the URL and summary once for every candidate title
+        keywords = _keywords(project_url, summary)
+        best_title, best_score = _best_title(titles, keywords)
+
+        # Only ask for a second round of titles when none of the first is good
+        if best_score < 3:
+            regenerate_key = (project_url, summary)
+            regenerated = self._regenerated_titles.get(regenerate_key)
+            if regenerated is None:
+                # Score each title as it streams in, keeping them for retries
+                regenerated = []
+                try:
+                    new_title, new_score = _best_title(
+                        _recorded(
+                            self.iter_titles(project_url, summary, reraise=True),
+                            regenerated,
+                        ),
+                        keywords,
+                    )
+                except Exception as e:
+                    # Titles cut short by an error are not kept, so a retry asks again
+                    print(f"An error occurred: {e}")
+                    new_title, new_score = _best_title(regenerated, keywords)
+                else:
+                    self._regenerated_titles[regenerate_key] = regenerated
+            else:
+                new_title, new_score = _best_title(regenerated, keywords)
+            # Ties keep the first round's title, as when the scores were merged
+            if new_title is not None and new_score > best_score:
+                best_title, best_score = new_title, new_score
+
+        if best_title is None:
+            return "No titles were generated.", "Unknown"
+
+        feedback = f"The best title is '{best_title}' with a score of {best_score}."
         return feedback, best_title
 
     def process_project(self, project_url, content):
-        summary = self.generate_summary(content)
-        titles = self.generate_multiple_titles(project_url, summary)
+        summary, titles = self.generate_summary_and_titles(project_url, content)
         feedback, best_title = self.evaluate_and_revise_titles(
             titles, project_url, summary
         )
         return best_title
+
+    async def aprocess_project(self, project_url, content):
+        # The OpenAI client is thread-safe and pools its connections, so running
+        # the blocking call in a worker thread overlaps network round trips
+        return await asyncio.to_thread(self.process_project, project_url, content)
+
+    def process_projects_batch(self, items, concurrency=10):
+        """Process (project_url, content) pairs concurrently, keeping input order."""
+
+        async def run():
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def bounded(project_url, content):
+                async with semaphore:
+                    return await self.aprocess_project(project_url, content)
+
+            return await asyncio.gather(*(bounded(url, text) for url, text in items))
+
+        return asyncio.run(run())
@@ -1,8 +1,10 @@
 import os
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer, BeautifulSoup
+
+from utils.http_session import session
 
 
 class ScrapingHandler:
@@ -12,27 +14,36 @@ class ScrapingHandler:
         self.course = course
         self.year = year
         self.subdirectory = f"{folder_path}/{course}/{year}"
-        if not os.path.exists(self.subdirectory):
-            os.makedirs(self.subdirectory)
 
     def scrape_data(self):
-        response = requests.get(self.url, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = session.get(self.url, timeout=10)
+        soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('table'))
         tables = soup.find_all('table')
         filenames = []
+        if tables:
+            os.makedirs(self.subdirectory, exist_ok=True)
         for i, table in enumerate(tables):
             file_name = f"scraped_data_tab_{i + 1}_{self.course}_{self.year}.csv"
             filenames.append(file_name)
+            rows = [
+                [cell.get_text() for cell in row.find_all(['td', 'th'])]
+                for row in table.find_all('tr')
+            ]
             with open(
                 f"{self.subdirectory}/{file_name}",
                 'w',
+                buffering=1 << 16,
                 newline='',
                 encoding='utf-8',
             ) as csvfile:
-                csvwriter = csv.writer(csvfile)
-                for row in table.find_all('tr'):
-                    csv_row = []
-                    for cell in row.find_all(['td', 'th']):
-                        csv_row.append(cell.get_text())
-                    csvwriter.writerow(csv_row)
+                csv.writer(csvfile).writerows(rows)
         return filenames
+
+    @classmethod
+    def scrape_many(cls, specs, max_workers=8):
+        """Scrape many (url, folder_path, course, year) pages concurrently.
+
+        Returns the saved file names for each page, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda spec: cls(*spec).scrape_data(), specs))